@@ -8,14 +8,24 @@ and the core deposit/retrieve/validate operations.
 """
 
 import uuid
+import bisect
+import heapq
+import itertools
 import json
 import math
+import time
 import hashlib
+from collections import Counter, deque
 from datetime import datetime, timezone
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Optional
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
 
 # ============================================================
 # Enums
@@ -46,11 +56,32 @@ class ConflictResolution(str, Enum):
     ADMIN_REVIEW = "admin_review"
 
 
+# Plain-string values, resolved once for hot aggregation paths
+_OUTCOME_VALUES = tuple(status.value for status in OutcomeStatus)
+_VALIDATION_VALUES = tuple(status.value for status in ValidationStatus)
+
+
 # ============================================================
 # Data Structures
 # ============================================================
 
-@dataclass
+def _install_to_dict(cls):
+    """
+    Generate a flat ``_to_dict`` method from the dataclass fields.
+
+    Equivalent to ``dataclasses.asdict`` for these leaf types (all fields
+    are scalars), but reads attributes directly instead of recursing and
+    deep-copying on every call.
+    """
+    body = ", ".join(f"{f.name!r}: self.{f.name}" for f in fields(cls))
+    namespace = {}
+    exec(f"def _to_dict(self):\n    return {{{body}}}", namespace)
+    cls._to_dict = namespace["_to_dict"]
+    return cls
+
+
+@_install_to_dict
+@dataclass(slots=True, frozen=True)
 class Step:
     """A single step in an agent's execution trace."""
     step_index: int
@@ -63,7 +94,8 @@ class Step:
     success: bool = True
 
 
-@dataclass
+@_install_to_dict
+@dataclass(slots=True, frozen=True)
 class Pivot:
     """Records when an agent changed its approach."""
     from_step: int
@@ -71,7 +103,8 @@ class Pivot:
     reason: str
 
 
-@dataclass
+@_install_to_dict
+@dataclass(slots=True, frozen=True)
 class Pattern:
     """An effective pattern or antipattern learned during execution."""
     pattern_id: str
@@ -83,7 +116,24 @@ class Pattern:
     alternative: str = ""
 
 
-@dataclass
+def _parse_timestamp(timestamp: str) -> Optional[float]:
+    """Parse an XR timestamp to epoch seconds; None if it is not timezone-aware ISO 8601."""
+    try:
+        xr_time = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        return None
+    if xr_time.tzinfo is None:
+        return None
+    return xr_time.timestamp()
+
+
+def _format_iso(timestamp_ns: int) -> str:
+    """Format a ``time.time_ns()`` value as a UTC ISO 8601 string."""
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(microsecond=nanos // 1000).isoformat()
+
+
+@dataclass(slots=True)
 class ExperienceRecord:
     """
     The atomic unit of AXTP — captures a single agent's
@@ -132,6 +182,24 @@ class ExperienceRecord:
 
     def to_dict(self) -> dict:
         """Serialize to AXTP-compliant dictionary."""
+        return self._as_dict(flatten=True)
+
+    def _as_dict(self, flatten: bool) -> dict:
+        """
+        Build the AXTP record shape. With ``flatten=False`` the trace and
+        learnings lists are left as dataclass instances for the encoder to
+        serialize in the same pass.
+        """
+        if flatten:
+            steps = [s._to_dict() for s in self.steps]
+            pivots = [p._to_dict() for p in self.pivots]
+            effective_patterns = [p._to_dict() for p in self.effective_patterns]
+            antipatterns = [p._to_dict() for p in self.antipatterns]
+        else:
+            steps = self.steps
+            pivots = self.pivots
+            effective_patterns = self.effective_patterns
+            antipatterns = self.antipatterns
         return {
             "xr_id": self.xr_id,
             "xr_version": self.xr_version,
@@ -145,8 +213,8 @@ class ExperienceRecord:
                 "parent_xr_id": self.parent_xr_id
             },
             "execution": {
-                "steps": [asdict(s) for s in self.steps],
-                "pivots": [asdict(p) for p in self.pivots],
+                "steps": steps,
+                "pivots": pivots,
                 "total_duration_ms": self.total_duration_ms,
                 "total_steps": len(self.steps),
                 "retries": self.retries
@@ -163,8 +231,8 @@ class ExperienceRecord:
                 "quality_self_assessment": self.quality_self_assessment
             },
             "learnings": {
-                "effective_patterns": [asdict(p) for p in self.effective_patterns],
-                "antipatterns": [asdict(p) for p in self.antipatterns],
+                "effective_patterns": effective_patterns,
+                "antipatterns": antipatterns,
                 "environmental_notes": self.environmental_notes,
                 "recommendations": self.recommendations
             },
@@ -175,14 +243,102 @@ class ExperienceRecord:
             }
         }
 
-    def to_json(self, indent: int = 2) -> str:
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: Optional[int] = None, pretty: bool = False) -> str:
+        """Compact JSON by default; ``pretty=True`` is shorthand for ``indent=2``."""
+        if pretty and indent is None:
+            indent = 2
+        return _dumps(self, indent=indent)
+
+    def content_hash(self) -> int:
+        """
+        64-bit fingerprint of the record's content, for deduplication.
+
+        Identity and trust fields (xr_id, timestamp, trust) are left out so
+        that re-submissions of the same experience hash alike. Because the
+        timestamp is excluded, a later re-run with identical content hashes
+        the same as the original. Uses stdlib JSON with sorted keys so the
+        value does not depend on whether orjson is installed; raises
+        TypeError or ValueError if the content is not JSON-encodable.
+        """
+        content = self.to_dict()
+        for key in ("xr_id", "timestamp", "trust"):
+            del content[key]
+        encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        digest = hashlib.blake2b(encoded.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+
+
+# ============================================================
+# Serialization
+# ============================================================
+
+def _json_default(o):
+    """Encode AXTP dataclasses without building an intermediate dict tree."""
+    if isinstance(o, (Step, Pivot, Pattern)):
+        return o._to_dict()
+    if isinstance(o, ExperienceRecord):
+        return o._as_dict(flatten=False)
+    # orjson encodes these natively; match it on the stdlib path
+    if isinstance(o, uuid.UUID):
+        return str(o)
+    if isinstance(o, Enum):
+        return o.value
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class AXTPEncoder(json.JSONEncoder):
+    """JSON encoder that serializes AXTP dataclasses in a single pass."""
+
+    def default(self, o):
+        return _json_default(o)
+
+
+def _dumps(obj, indent: Optional[int] = None) -> str:
+    """
+    Encode to a JSON string, using orjson when it is installed.
+
+    Both paths write compact separators (or orjson's ``indent=2`` layout),
+    non-ASCII text unescaped, UUIDs as strings and Enums by value, and both
+    reject datetimes. Inputs orjson refuses (e.g. integers beyond 64 bits)
+    fall back to stdlib json. The outputs are not byte-identical for every
+    input: under orjson NaN and Infinity are written as ``null``, and floats
+    with exponents are formatted as ``1e16`` rather than ``1e+16``.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option).decode()
+        except orjson.JSONEncodeError:
+            pass
+    separators = (",", ":") if indent is None else None
+    return json.dumps(obj, cls=AXTPEncoder, indent=indent, separators=separators, ensure_ascii=False)
 
 
 # ============================================================
 # Trust Engine
 # ============================================================
 
+def _consistency(
+    task_ix: int,
+    outcome_status: OutcomeStatus,
+    task_counts: Counter,
+    task_outcome_counts: Counter
+) -> float:
+    """
+    How well a pooled XR aligns with the other pooled XRs of its task type.
+    ``task_ix`` is the pool's id for the task type; the counters include the XR itself.
+    """
+    others = task_counts[task_ix] - 1
+    if others <= 0:
+        return 0.5
+    return (task_outcome_counts[(task_ix, outcome_status)] - 1) / others
+
+
+_TRUST_EPOCHS = itertools.count()
+
+
 class TrustEngine:
     """
     Computes and maintains trust scores for Experience Records.
@@ -214,6 +370,18 @@ class TrustEngine:
         self.decay_rate = decay_rate
         self.agent_reputations: dict[str, float] = {}  # agent_id -> reputation
         self.outcome_feedback: dict[str, list[bool]] = {}  # xr_id -> [helpful, not helpful, ...]
+        # Advanced whenever a reputation, validation or feedback input changes.
+        # Drawn from a process-wide counter so a pool's cached scores never
+        # match the epoch of a different engine assigned to it later.
+        self._trust_epoch = next(_TRUST_EPOCHS)
+
+    def invalidate(self):
+        """
+        Mark every cached trust component as stale.
+
+        Call after editing ``agent_reputations`` or ``outcome_feedback`` directly.
+        """
+        self._trust_epoch = next(_TRUST_EPOCHS)
 
     def get_agent_reputation(self, agent_id: str) -> float:
         """Get an agent's reputation score, defaulting to 0.5 for unknown agents."""
@@ -223,6 +391,7 @@ class TrustEngine:
         """Adjust an agent's reputation score."""
         current = self.get_agent_reputation(agent_id)
         self.agent_reputations[agent_id] = max(0.0, min(1.0, current + delta))
+        self.invalidate()
 
     def compute_recency_factor(self, timestamp: str) -> float:
         """Apply exponential decay based on age of experience."""
@@ -234,6 +403,12 @@ class TrustEngine:
         except (ValueError, TypeError):
             return 0.5
 
+    def _recency(self, ts: Optional[float], now: float) -> float:
+        """Recency factor from a pre-parsed timestamp (epoch seconds)."""
+        if ts is None:
+            return 0.5
+        return math.exp(-self.decay_rate * (now - ts) / 86400)
+
     def compute_validation_score(self, xr: ExperienceRecord) -> float:
         """Score based on validation status and number of validators."""
         if xr.validation_status == ValidationStatus.VALIDATED:
@@ -249,41 +424,145 @@ class TrustEngine:
             return 0.5
         return sum(1 for f in feedback if f) / len(feedback)
 
-    def compute_trust_score(self, xr: ExperienceRecord, pool_xrs: list[ExperienceRecord] = None) -> float:
-        """Compute composite trust score for an Experience Record."""
-        reputation = self.get_agent_reputation(xr.agent_id)
-        validation = self.compute_validation_score(xr)
-        outcome = self.compute_outcome_score(xr.xr_id)
-        recency = self.compute_recency_factor(xr.timestamp)
-
-        # Consistency: how well does this XR align with others of the same task type?
-        consistency = 0.5
-        if pool_xrs:
-            same_type = [x for x in pool_xrs if x.task_type == xr.task_type and x.xr_id != xr.xr_id]
-            if same_type:
-                same_outcome = sum(1 for x in same_type if x.outcome_status == xr.outcome_status)
-                consistency = same_outcome / len(same_type)
+    def compute_trust_score(self, xr: ExperienceRecord, pool_view: "ExperiencePool" = None) -> float:
+        """
+        Compute composite trust score for an Experience Record.
 
+        Reputation, validation and outcome only change on validation,
+        feedback or reputation events, so for an XR pooled in ``pool_view``
+        that part is cached by the pool until the engine's trust epoch moves
+        on. Consistency is read from ``pool_view``'s running task counters;
+        without a pool it is neutral.
+        """
+        if pool_view is None:
+            base = self._base_score(xr)
+            ts = _parse_timestamp(xr.timestamp)
+            consistency = 0.5
+        else:
+            base = self._cached_base_score(xr, pool_view)
+            ts = pool_view._timestamp_epoch(xr)
+            consistency = pool_view._consistency_of(xr)
+        recency = self._recency(ts, time.time())
         score = (
-            self.weights["reputation"] * reputation +
-            self.weights["validation"] * validation +
-            self.weights["outcome"] * outcome +
+            base +
             self.weights["recency"] * recency +
             self.weights["consistency"] * consistency
         )
         return round(max(0.0, min(1.0, score)), 4)
 
+    def _base_score(self, xr: ExperienceRecord) -> float:
+        """Weighted reputation, validation and outcome components of the trust score."""
+        reputation = self.get_agent_reputation(xr.agent_id)
+        validation = self.compute_validation_score(xr)
+        outcome = self.compute_outcome_score(xr.xr_id)
+        return (
+            self.weights["reputation"] * reputation +
+            self.weights["validation"] * validation +
+            self.weights["outcome"] * outcome
+        )
+
+    def _cached_base_score(self, xr: ExperienceRecord, pool_view: "ExperiencePool") -> float:
+        """``_base_score``, cached in ``pool_view`` per pooled XR for the current trust epoch."""
+        if pool_view._records.get(xr.xr_id) is not xr:
+            return self._base_score(xr)
+        cached = pool_view._base_scores.get(xr.xr_id)
+        if cached is None or cached[0] != self._trust_epoch:
+            cached = pool_view._base_scores[xr.xr_id] = (self._trust_epoch, self._base_score(xr))
+        return cached[1]
+
+    def _bulk_trust(
+        self,
+        xrs: list[ExperienceRecord],
+        now: float,
+        pool_view: "ExperiencePool"
+    ) -> list[tuple[float, float]]:
+        """
+        Score many XRs from ``pool_view`` in one call, returning ``(trust_score, recency)`` pairs.
+
+        Equivalent to calling compute_trust_score per XR, with the weight and
+        clock lookups hoisted out of the loop and the pool's caches read inline.
+        """
+        epoch = self._trust_epoch
+        weight_recency = self.weights["recency"]
+        weight_consistency = self.weights["consistency"]
+        decay_per_second = self.decay_rate / 86400
+        exp = math.exp
+        indexed = pool_view._indexed
+        base_scores = pool_view._base_scores
+        timestamps = pool_view._timestamps
+        task_counts = pool_view._task_counts
+        task_outcome_counts = pool_view._task_outcome_counts
+        results = []
+        for xr in xrs:
+            xr_id = xr.xr_id
+            cached = base_scores.get(xr_id)
+            if cached is None or cached[0] != epoch:
+                cached = base_scores[xr_id] = (epoch, self._base_score(xr))
+            stamp = timestamps.get(xr_id)
+            if stamp is None or stamp[0] is not xr.timestamp:
+                stamp = timestamps[xr_id] = (xr.timestamp, _parse_timestamp(xr.timestamp))
+            ts = stamp[1]
+            recency = 0.5 if ts is None else exp(-decay_per_second * (now - ts))
+            _, task_ix, outcome_status = indexed[xr_id]
+            consistency = _consistency(task_ix, outcome_status, task_counts, task_outcome_counts)
+            score = cached[1] + weight_recency * recency + weight_consistency * consistency
+            results.append((round(max(0.0, min(1.0, score)), 4), recency))
+        return results
+
     def record_feedback(self, xr_id: str, was_helpful: bool):
         """Record downstream outcome feedback for an XR."""
         if xr_id not in self.outcome_feedback:
             self.outcome_feedback[xr_id] = []
         self.outcome_feedback[xr_id].append(was_helpful)
+        self.invalidate()
 
 
 # ============================================================
 # Experience Pool
 # ============================================================
 
+def _intern(ids: dict[str, int], next_ix: "itertools.count[int]", name: str) -> int:
+    """Return the small-int id for ``name``, assigning a fresh one from ``next_ix`` if new."""
+    ix = ids.get(name)
+    if ix is None:
+        ix = ids[name] = next(next_ix)
+    return ix
+
+
+_AUDIT_OPERATIONS = ("deposit", "retrieve", "validate", "evict")
+_AUDIT_OP_CODES = {op: code for code, op in enumerate(_AUDIT_OPERATIONS)}
+
+
+class _AuditLog:
+    """
+    Append-only audit trail kept as compact tuples.
+
+    Entries are ``(timestamp_ns, op_code, actor, xr_ids, outcome)``; iterating
+    expands them back into audit dicts. Unbounded by default, as the protocol
+    requires every operation to be logged. A ``maxlen`` opts into a ring
+    buffer that drops the oldest entries.
+    """
+
+    def __init__(self, maxlen: Optional[int] = None):
+        self._entries: deque[tuple] = deque(maxlen=maxlen)
+
+    def append(self, entry: tuple):
+        self._entries.append(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        for timestamp_ns, op_code, actor, xr_ids, outcome in self._entries:
+            yield {
+                "timestamp": _format_iso(timestamp_ns),
+                "operation": _AUDIT_OPERATIONS[op_code],
+                "actor": actor,
+                "xr_ids": list(xr_ids),
+                "outcome": outcome
+            }
+
+
 class ExperiencePool:
     """
     A managed collection of Experience Records with governance controls.
@@ -296,7 +575,9 @@ class ExperiencePool:
         validation_required: bool = True,
         min_confidence_threshold: float = 0.3,
         conflict_resolution: ConflictResolution = ConflictResolution.LATEST_WINS,
-        max_records: int = 10000
+        max_records: int = 10000,
+        deduplicate: bool = False,
+        max_audit_entries: Optional[int] = None
     ):
         self.pool_id = str(uuid.uuid4())
         self.pool_name = pool_name
@@ -307,7 +588,37 @@ class ExperiencePool:
         self.max_records = max_records
 
         self._records: dict[str, ExperienceRecord] = {}
-        self._audit_log: list[dict] = []
+        self._by_task: dict[str, dict[str, ExperienceRecord]] = {}  # task_type -> {xr_id: xr}
+        self._task_types: list[str] = []  # sorted keys of _by_task, for prefix lookups
+        # xr_id -> (task_type, task id, outcome_status) as indexed, so a record
+        # mutated after deposit is still scored against and removed from the
+        # buckets and counters it was added to
+        self._indexed: dict[str, tuple[str, int, OutcomeStatus]] = {}
+        self.deduplicate = deduplicate
+        self._by_hash: dict[int, str] = {}  # content_hash -> xr_id
+        self._content_hashes: dict[str, int] = {}  # xr_id -> content_hash
+        # Task interning table: name -> small int id. Ids are never reused, since
+        # a task's entry is dropped once its last XR leaves the pool
+        self._task_ids: dict[str, int] = {}
+        self._next_task_ix = itertools.count()
+        # Running counts behind the consistency signal, keyed by task id
+        self._task_counts: Counter[int] = Counter()
+        self._task_outcome_counts: Counter[tuple[int, OutcomeStatus]] = Counter()
+        # Per-XR scoring caches, kept off the records themselves:
+        # xr_id -> (trust epoch, TrustEngine._base_score) and
+        # xr_id -> (timestamp string, parsed epoch seconds)
+        self._base_scores: dict[str, tuple[int, float]] = {}
+        self._timestamps: dict[str, tuple[str, Optional[float]]] = {}
+        # Min-heap of (confidence_score, timestamp, insertion seq, xr_id); entries go
+        # stale when a score changes or an XR leaves the pool and are skipped on pop.
+        # The pool pushes a fresh key whenever it changes a score itself; a score
+        # lowered directly by a caller is only picked up once its stale entry
+        # surfaces. The insertion sequence breaks exact ties in _records order, as
+        # min() over _records does; replacing an XR under its id keeps its place.
+        self._eviction_heap: list[tuple[float, str, int, str]] = []
+        self._insertion_seq: dict[str, int] = {}  # xr_id -> seq
+        self._next_seq = itertools.count()
+        self._audit_log = _AuditLog(max_audit_entries)
         self.trust_engine = TrustEngine()
 
     # --- Core Operations ---
@@ -322,25 +633,60 @@ class ExperiencePool:
         if not xr.agent_id or not xr.task_type:
             return {"status": "rejected", "reason": "Missing required fields (agent_id, task_type)"}
 
+        now_ns = time.time_ns()
+
+        # Idempotency (opt-in): identical content already pooled under another
+        # id is not stored again. The timestamp is not part of the content, so
+        # a later identical re-run does not refresh the pooled experience.
+        content_hash = None
+        existing_id = None
+        if self.deduplicate:
+            try:
+                content_hash = xr.content_hash()
+            except (TypeError, ValueError):
+                pass  # content is not JSON-encodable; accept without deduplication
+            else:
+                existing_id = self._by_hash.get(content_hash)
+        if existing_id is not None and existing_id != xr.xr_id:
+            existing = self._records[existing_id]
+            self._log("deposit", xr.agent_id, [existing_id], "duplicate", now_ns)
+            return {
+                "status": "duplicate",
+                "xr_id": existing_id,
+                "pool_id": self.pool_id,
+                "confidence_score": existing.confidence_score,
+                "timestamp": _format_iso(now_ns)
+            }
+
         # Capacity check
         if len(self._records) >= self.max_records:
-            self._evict_oldest()
+            self._evict_oldest(now_ns)
 
-        # Compute initial trust score
-        xr.confidence_score = self.trust_engine.compute_trust_score(xr, list(self._records.values()))
+        # Replacing an XR with the same id drops the old one from the indices
+        if xr.xr_id in self._records:
+            self._unindex(xr.xr_id)
+        else:
+            self._insertion_seq[xr.xr_id] = next(self._next_seq)
+        if content_hash is not None:
+            self._content_hashes[xr.xr_id] = content_hash
 
         # Store
         self._records[xr.xr_id] = xr
+        self._index(xr)
+
+        # Compute initial trust score
+        xr.confidence_score = self.trust_engine.compute_trust_score(xr, self)
+        self._push_eviction_key(xr)
 
         # Audit
-        self._log("deposit", xr.agent_id, [xr.xr_id], "accepted")
+        self._log("deposit", xr.agent_id, [xr.xr_id], "accepted", now_ns)
 
         return {
             "status": "accepted",
             "xr_id": xr.xr_id,
             "pool_id": self.pool_id,
             "confidence_score": xr.confidence_score,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _format_iso(now_ns)
         }
 
     def retrieve(
@@ -360,35 +706,33 @@ class ExperiencePool:
         if min_confidence is None:
             min_confidence = self.min_confidence_threshold
 
-        candidates = list(self._records.values())
-
         # Filter by task type (supports prefix matching)
         if task_type:
-            candidates = [
-                xr for xr in candidates
-                if xr.task_type == task_type or xr.task_type.startswith(task_type + ".")
-            ]
+            candidates = self._match_task(task_type)
+        else:
+            candidates = list(self._records.values())
 
         # Filter by outcome
         if outcome_filter:
             candidates = [xr for xr in candidates if xr.outcome_status == outcome_filter]
 
-        # Recompute trust scores with current pool state
-        for xr in candidates:
-            xr.confidence_score = self.trust_engine.compute_trust_score(xr, list(self._records.values()))
-
-        # Filter by confidence
-        candidates = [xr for xr in candidates if xr.confidence_score >= min_confidence]
-
-        # Score and rank
+        # Recompute trust scores with current pool state, filter by
+        # confidence and score in a single pass
         scored = []
-        for xr in candidates:
+        trust_weight = 1 - recency_weight
+        trust = self.trust_engine._bulk_trust(candidates, time.time(), self)
+        for xr, (confidence, recency) in zip(candidates, trust):
+            if confidence != xr.confidence_score:
+                xr.confidence_score = confidence
+                self._push_eviction_key(xr)
+            if confidence < min_confidence:
+                continue
             # Composite relevance = trust score weighted by recency preference
-            recency = self.trust_engine.compute_recency_factor(xr.timestamp)
-            relevance = (1 - recency_weight) * xr.confidence_score + recency_weight * recency
+            relevance = trust_weight * xr.confidence_score + recency_weight * recency
             scored.append((relevance, xr))
 
-        scored.sort(key=lambda x: x[0], reverse=True)
+        # Rank: partial selection of the top results instead of a full sort
+        scored = heapq.nlargest(max_results, scored, key=lambda x: x[0])
 
         results = [
             {
@@ -399,12 +743,12 @@ class ExperiencePool:
                 "outcome_status": xr.outcome_status.value,
                 "result_summary": xr.result_summary,
                 "learnings": {
-                    "effective_patterns": [asdict(p) for p in xr.effective_patterns],
-                    "antipatterns": [asdict(p) for p in xr.antipatterns],
+                    "effective_patterns": [p._to_dict() for p in xr.effective_patterns],
+                    "antipatterns": [p._to_dict() for p in xr.antipatterns],
                     "recommendations": xr.recommendations
                 }
             }
-            for rel, xr in scored[:max_results]
+            for rel, xr in scored
         ]
 
         # Audit
@@ -447,8 +791,11 @@ class ExperiencePool:
             xr.validator_ids.append(validator_id)
             # Amendments don't change status but add to the record
 
+        self.trust_engine.invalidate()
+
         # Recompute trust
-        xr.confidence_score = self.trust_engine.compute_trust_score(xr, list(self._records.values()))
+        xr.confidence_score = self.trust_engine.compute_trust_score(xr, self)
+        self._push_eviction_key(xr)
 
         # Audit
         self._log("validate", validator_id, [xr_id], f"{validation_type.value}: {evidence[:100]}")
@@ -462,47 +809,144 @@ class ExperiencePool:
 
     def inspect(self) -> dict:
         """INSPECT: Get pool metadata and health statistics."""
-        records = list(self._records.values())
+        # Aggregate everything in a single pass over the records
+        agents = set()
+        confidence_sum = 0.0
+        # Status enums are str subclasses, so they index these value-keyed dicts directly
+        outcome_counts = dict.fromkeys(_OUTCOME_VALUES, 0)
+        validation_counts = dict.fromkeys(_VALIDATION_VALUES, 0)
+        last = None
+        for xr in self._records.values():
+            agents.add(xr.agent_id)
+            confidence_sum += xr.confidence_score
+            outcome_counts[xr.outcome_status] += 1
+            validation_counts[xr.validation_status] += 1
+            last = xr
+
+        total = len(self._records)
         return {
             "pool_id": self.pool_id,
             "pool_name": self.pool_name,
             "scope": self.scope,
-            "total_xrs": len(records),
-            "contributing_agents": len(set(xr.agent_id for xr in records)),
-            "avg_confidence": round(
-                sum(xr.confidence_score for xr in records) / len(records), 4
-            ) if records else 0.0,
-            "task_types": list(set(xr.task_type for xr in records)),
-            "outcome_distribution": {
-                status.value: sum(1 for xr in records if xr.outcome_status == status)
-                for status in OutcomeStatus
-            },
-            "validation_distribution": {
-                status.value: sum(1 for xr in records if xr.validation_status == status)
-                for status in ValidationStatus
-            },
+            "total_xrs": total,
+            "contributing_agents": len(agents),
+            "avg_confidence": round(confidence_sum / total, 4) if total else 0.0,
+            "task_types": list(self._task_types),
+            "outcome_distribution": outcome_counts,
+            "validation_distribution": validation_counts,
             "audit_entries": len(self._audit_log),
-            "last_updated": records[-1].timestamp if records else None
+            "last_updated": last.timestamp if last else None
         }
 
     # --- Internal ---
 
-    def _evict_oldest(self):
+    def _evict_oldest(self, timestamp_ns: Optional[int] = None):
         """Remove the oldest, lowest-trust record to make room."""
         if not self._records:
             return
-        worst = min(self._records.values(), key=lambda xr: (xr.confidence_score, xr.timestamp))
+        while True:
+            if not self._eviction_heap:
+                self._rebuild_eviction_heap()
+            confidence, timestamp, _, xr_id = heapq.heappop(self._eviction_heap)
+            worst = self._records.get(xr_id)
+            if worst is None:
+                continue
+            if worst.confidence_score == confidence and worst.timestamp == timestamp:
+                break
+            # Live record whose key changed outside the pool: requeue its current key
+            self._push_eviction_key(worst)
         del self._records[worst.xr_id]
-        self._log("evict", "system", [worst.xr_id], "capacity limit reached")
-
-    def _log(self, operation: str, actor: str, xr_ids: list[str], outcome: str):
-        self._audit_log.append({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "operation": operation,
-            "actor": actor,
-            "xr_ids": xr_ids,
-            "outcome": outcome
-        })
+        del self._insertion_seq[worst.xr_id]
+        self._unindex(worst.xr_id)
+        self._log("evict", "system", [worst.xr_id], "capacity limit reached", timestamp_ns)
+
+    def _eviction_key(self, xr: ExperienceRecord) -> tuple[float, str, int, str]:
+        return (xr.confidence_score, xr.timestamp, self._insertion_seq[xr.xr_id], xr.xr_id)
+
+    def _push_eviction_key(self, xr: ExperienceRecord):
+        heapq.heappush(self._eviction_heap, self._eviction_key(xr))
+        # Keep stale entries from outgrowing the pool
+        if len(self._eviction_heap) > 2 * len(self._records) + 16:
+            self._rebuild_eviction_heap()
+
+    def _rebuild_eviction_heap(self):
+        self._eviction_heap = [self._eviction_key(xr) for xr in self._records.values()]
+        heapq.heapify(self._eviction_heap)
+
+    def _index(self, xr: ExperienceRecord):
+        task_ix = _intern(self._task_ids, self._next_task_ix, xr.task_type)
+        self._indexed[xr.xr_id] = (xr.task_type, task_ix, xr.outcome_status)
+        bucket = self._by_task.get(xr.task_type)
+        if bucket is None:
+            bucket = self._by_task[xr.task_type] = {}
+            bisect.insort(self._task_types, xr.task_type)
+        bucket[xr.xr_id] = xr
+        content_hash = self._content_hashes.get(xr.xr_id)
+        if content_hash is not None:
+            self._by_hash[content_hash] = xr.xr_id
+        self._task_counts[task_ix] += 1
+        self._task_outcome_counts[(task_ix, xr.outcome_status)] += 1
+
+    def _unindex(self, xr_id: str):
+        """Drop ``xr_id`` from the indices using the key it was indexed under."""
+        task_type, task_ix, outcome_status = self._indexed.pop(xr_id)
+        self._base_scores.pop(xr_id, None)
+        self._timestamps.pop(xr_id, None)
+        bucket = self._by_task[task_type]
+        del bucket[xr_id]
+        content_hash = self._content_hashes.pop(xr_id, None)
+        if content_hash is not None and self._by_hash.get(content_hash) == xr_id:
+            del self._by_hash[content_hash]
+        outcome_key = (task_ix, outcome_status)
+        self._task_outcome_counts[outcome_key] -= 1
+        if not self._task_outcome_counts[outcome_key]:
+            del self._task_outcome_counts[outcome_key]
+        self._task_counts[task_ix] -= 1
+        if not bucket:
+            del self._task_counts[task_ix]
+            del self._task_ids[task_type]
+            del self._by_task[task_type]
+            del self._task_types[bisect.bisect_left(self._task_types, task_type)]
+
+    def _timestamp_epoch(self, xr: ExperienceRecord) -> Optional[float]:
+        """Epoch seconds for ``xr.timestamp``; re-parsed for a pooled XR only when the string is replaced."""
+        if self._records.get(xr.xr_id) is not xr:
+            return _parse_timestamp(xr.timestamp)
+        cached = self._timestamps.get(xr.xr_id)
+        if cached is None or cached[0] is not xr.timestamp:
+            cached = self._timestamps[xr.xr_id] = (xr.timestamp, _parse_timestamp(xr.timestamp))
+        return cached[1]
+
+    def _consistency_of(self, xr: ExperienceRecord) -> float:
+        if self._records.get(xr.xr_id) is xr:
+            _, task_ix, outcome_status = self._indexed[xr.xr_id]
+            return _consistency(task_ix, outcome_status, self._task_counts, self._task_outcome_counts)
+        task_ix = self._task_ids.get(xr.task_type)
+        # Not pooled (yet): compare against every pooled XR of the task type
+        if task_ix is None or not self._task_counts[task_ix]:
+            return 0.5
+        return self._task_outcome_counts[(task_ix, xr.outcome_status)] / self._task_counts[task_ix]
+
+    def _match_task(self, task_type: str) -> list[ExperienceRecord]:
+        """XRs whose task type is ``task_type`` or nested under it (``task_type.*``)."""
+        matches = list(self._by_task.get(task_type, {}).values())
+        prefix = task_type + "."
+        i = bisect.bisect_left(self._task_types, prefix)
+        while i < len(self._task_types) and self._task_types[i].startswith(prefix):
+            matches.extend(self._by_task[self._task_types[i]].values())
+            i += 1
+        return matches
+
+    def _log(self, operation: str, actor: str, xr_ids: list[str], outcome: str, timestamp_ns: Optional[int] = None):
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        self._audit_log.append((
+            timestamp_ns,
+            _AUDIT_OP_CODES[operation],
+            actor,
+            tuple(xr_ids),
+            outcome
+        ))
 
 
 # ============================================================
@@ -0,0 +1,335 @@
+"""Tests for the AXTP reference implementation.
+
+Run from the repository root with ``python -m unittest discover -s tests``.
+"""
+
+import os
+import random
+import sys
+import unittest
+import uuid
+from dataclasses import asdict, fields
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import axtp  # noqa: E402
+from axtp import ExperiencePool, ExperienceRecord, OutcomeStatus, Pattern, Step, ValidationType  # noqa: E402
+
+
+def make_xr(task_type="code.debug", outcome=OutcomeStatus.SUCCESS, **kwargs) -> ExperienceRecord:
+    kwargs.setdefault("agent_id", "agent-1")
+    return ExperienceRecord(task_type=task_type, outcome_status=outcome, **kwargs)
+
+
+class TestIndexing(unittest.TestCase):
+
+    def test_redeposit_after_task_type_change(self):
+        pool = ExperiencePool("test")
+        xr = make_xr("code.debug")
+        pool.deposit(xr)
+        xr.task_type = "code.review"
+        receipt = pool.deposit(xr)
+        self.assertEqual(receipt["status"], "accepted")
+        self.assertEqual(pool.inspect()["task_types"], ["code.review"])
+        self.assertEqual([r["xr_id"] for r in pool.retrieve("code.review", min_confidence=0)], [xr.xr_id])
+        self.assertEqual(pool.retrieve("code.debug", min_confidence=0), [])
+
+    def test_evict_after_task_type_change(self):
+        pool = ExperiencePool("test", max_records=1)
+        first = make_xr("code.debug")
+        pool.deposit(first)
+        first.task_type = "code.review"
+        second = make_xr("data.etl")
+        pool.deposit(second)
+        self.assertEqual(list(pool._records), [second.xr_id])
+        self.assertEqual(pool.inspect()["task_types"], ["data.etl"])
+
+    def test_redeposit_after_outcome_change_keeps_counts(self):
+        pool = ExperiencePool("test")
+        pool.deposit(make_xr(outcome=OutcomeStatus.FAILURE))
+        xr = make_xr(outcome=OutcomeStatus.FAILURE)
+        pool.deposit(xr)
+        xr.outcome_status = OutcomeStatus.SUCCESS
+        pool.deposit(xr)
+        task_ix = pool._task_ids["code.debug"]
+        self.assertEqual(pool._task_outcome_counts[(task_ix, OutcomeStatus.SUCCESS)], 1)
+        self.assertEqual(pool._task_outcome_counts[(task_ix, OutcomeStatus.FAILURE)], 1)
+        self.assertEqual(pool.inspect()["outcome_distribution"]["success"], 1)
+
+    def test_retrieve_after_pooled_task_type_change(self):
+        pool = ExperiencePool("test")
+        xr = make_xr("code.debug")
+        pool.deposit(xr)
+        xr.task_type = "unseen.task"
+        self.assertEqual(len(pool.retrieve(min_confidence=0)), 1)
+        self.assertEqual(len(pool.retrieve("code.debug", min_confidence=0)), 1)
+
+    def test_str_subclass_identifiers(self):
+        class TaskType(str, Enum):
+            DEBUG = "code.debug"
+
+        pool = ExperiencePool("test")
+        receipt = pool.deposit(make_xr(TaskType.DEBUG, agent_id=TaskType.DEBUG))
+        self.assertEqual(receipt["status"], "accepted")
+        self.assertEqual(len(pool.retrieve("code.debug", min_confidence=0)), 1)
+
+    def test_replace_only_record_of_task(self):
+        pool = ExperiencePool("test")
+        xr = make_xr("code.debug")
+        pool.deposit(xr)
+        pool.deposit(xr)
+        self.assertEqual(pool._consistency_of(xr), 0.5)
+        self.assertEqual(pool.inspect()["task_types"], ["code.debug"])
+
+    def test_task_tables_shrink_with_pool(self):
+        pool = ExperiencePool("test", max_records=3)
+        for i in range(50):
+            pool.deposit(make_xr(f"task.{i}", list(OutcomeStatus)[i % 4]))
+        self.assertEqual(len(pool._task_ids), 3)
+        self.assertEqual(len(pool._task_counts), 3)
+        self.assertEqual(len(pool._task_outcome_counts), 3)
+        self.assertEqual(sorted(pool._task_ids.values()), sorted(ix for _, ix, _ in pool._indexed.values()))
+
+
+def scan_consistency(pool: ExperiencePool, xr: ExperienceRecord) -> float:
+    """Consistency computed the original way, by scanning the pooled records."""
+    same_task = [other for other in pool._records.values() if other.task_type == xr.task_type and other is not xr]
+    if not same_task:
+        return 0.5
+    return sum(other.outcome_status == xr.outcome_status for other in same_task) / len(same_task)
+
+
+class TestConsistency(unittest.TestCase):
+
+    def test_counters_match_list_scan(self):
+        rng = random.Random(7)
+        pool = ExperiencePool("test", max_records=40)
+        for i in range(300):
+            xr = make_xr(
+                rng.choice(["a", "a.b", "c"]),
+                rng.choice(list(OutcomeStatus)),
+                agent_id=f"agent-{rng.randint(0, 5)}",
+                objective=str(i)
+            )
+            pool.deposit(xr)
+            if i % 5 == 0:
+                pool.validate(rng.choice(list(pool._records)), "validator", rng.choice(list(ValidationType)))
+            if i % 13 == 0:
+                # replace a pooled record under its own id with a different key
+                old = pool._records[rng.choice(list(pool._records))]
+                pool.deposit(make_xr("c", rng.choice(list(OutcomeStatus)), xr_id=old.xr_id, objective=f"r{i}"))
+        for xr in pool._records.values():
+            self.assertAlmostEqual(pool._consistency_of(xr), scan_consistency(pool, xr), places=12)
+        outside = make_xr("a", OutcomeStatus.FAILURE)
+        same_task = [other for other in pool._records.values() if other.task_type == "a"]
+        expected = sum(other.outcome_status == OutcomeStatus.FAILURE for other in same_task) / len(same_task)
+        self.assertAlmostEqual(pool._consistency_of(outside), expected, places=12)
+
+
+class TestEviction(unittest.TestCase):
+    TIMESTAMP = "2026-01-01T00:00:00+00:00"
+
+    def deposit_checked(self, pool: ExperiencePool, xr: ExperienceRecord):
+        """Deposit ``xr``, asserting the pool evicts what min() over its records would."""
+        expected = []
+        if len(pool._records) >= pool.max_records:
+            worst = min(pool._records.values(), key=lambda x: (x.confidence_score, x.timestamp))
+            expected = [worst.xr_id]
+        logged = len(pool._audit_log)
+        pool.deposit(xr)
+        new_entries = (pool._audit_log._entries[i] for i in range(logged, len(pool._audit_log)))
+        evicted = [
+            xr_id for _, op_code, _, xr_ids, _ in new_entries
+            if op_code == axtp._AUDIT_OP_CODES["evict"] for xr_id in xr_ids
+        ]
+        self.assertEqual(evicted, expected)
+
+    def test_exact_ties_evict_in_insertion_order(self):
+        pool = ExperiencePool("test", max_records=5)
+        xrs = [make_xr(timestamp=self.TIMESTAMP, objective=str(i)) for i in range(12)]
+        for xr in xrs:
+            self.deposit_checked(pool, xr)
+        self.assertEqual(list(pool._records), [xr.xr_id for xr in xrs[-5:]])
+
+    def test_replacement_keeps_insertion_place(self):
+        pool = ExperiencePool("test", max_records=3)
+        first, second = (make_xr(timestamp=self.TIMESTAMP, objective=str(i)) for i in range(2))
+        for xr in (first, second):
+            pool.deposit(xr)
+        pool.deposit(make_xr(timestamp=self.TIMESTAMP, objective="0", xr_id=first.xr_id))
+        pool.deposit(make_xr(timestamp=self.TIMESTAMP, objective="2"))
+        self.deposit_checked(pool, make_xr(timestamp=self.TIMESTAMP, objective="3"))
+        self.assertNotIn(first.xr_id, pool._records)
+        self.assertIn(second.xr_id, pool._records)
+
+    def test_matches_min_scan(self):
+        rng = random.Random(3)
+        timestamps = [self.TIMESTAMP, "2026-02-01T00:00:00+00:00", "not a timestamp"]
+        pool = ExperiencePool("test", max_records=25)
+        for i in range(400):
+            self.deposit_checked(pool, make_xr(
+                rng.choice(["a", "a.b", "c"]),
+                rng.choice(list(OutcomeStatus)),
+                agent_id=f"agent-{rng.randint(0, 3)}",
+                timestamp=rng.choice(timestamps),
+                objective=str(i)
+            ))
+            if i % 7 == 0:
+                pool.retrieve(rng.choice(["a", "c", None]), min_confidence=0)
+            if i % 5 == 0:
+                pool.validate(rng.choice(list(pool._records)), "validator", rng.choice(list(ValidationType)))
+            if i % 11 == 0:
+                pool.trust_engine.record_feedback(rng.choice(list(pool._records)), rng.random() < 0.5)
+            if i % 17 == 0:
+                old = pool._records[rng.choice(list(pool._records))]
+                self.deposit_checked(pool, make_xr("c", xr_id=old.xr_id, timestamp=old.timestamp, objective=f"r{i}"))
+        self.assertLessEqual(len(pool._eviction_heap), 2 * len(pool._records) + 16)
+        self.assertEqual(set(pool._insertion_seq), set(pool._records))
+
+
+class TestDeduplication(unittest.TestCase):
+
+    def test_off_by_default(self):
+        pool = ExperiencePool("test")
+        pool.deposit(make_xr())
+        self.assertEqual(pool.deposit(make_xr())["status"], "accepted")
+        self.assertEqual(len(pool._records), 2)
+
+    def test_identical_content_returns_pooled_id(self):
+        pool = ExperiencePool("test", deduplicate=True)
+        original = make_xr(objective="same")
+        pool.deposit(original)
+        receipt = pool.deposit(make_xr(objective="same", timestamp="2026-01-01T00:00:00+00:00"))
+        self.assertEqual(receipt["status"], "duplicate")
+        self.assertEqual(receipt["xr_id"], original.xr_id)
+        self.assertEqual(list(pool._records), [original.xr_id])
+        # re-depositing under the pooled id replaces rather than deduplicates
+        self.assertEqual(pool.deposit(make_xr(objective="same", xr_id=original.xr_id))["status"], "accepted")
+
+    def test_evicted_content_can_return(self):
+        pool = ExperiencePool("test", max_records=1, deduplicate=True)
+        original = make_xr(objective="same")
+        pool.deposit(original)
+        pool.deposit(make_xr(objective="other"))
+        again = make_xr(objective="same")
+        self.assertEqual(pool.deposit(again)["status"], "accepted")
+        self.assertEqual(set(pool._by_hash.values()), {again.xr_id})
+        self.assertEqual(set(pool._content_hashes), {again.xr_id})
+
+    def test_unencodable_content_is_accepted(self):
+        pool = ExperiencePool("test", deduplicate=True)
+        for _ in range(2):
+            self.assertEqual(pool.deposit(make_xr(environment={"key": object()}))["status"], "accepted")
+        self.assertEqual(len(pool._records), 2)
+        self.assertEqual(pool._content_hashes, {})
+
+
+class TestTrustCache(unittest.TestCase):
+
+    def test_record_exposes_no_engine_state(self):
+        names = {f.name for f in fields(ExperienceRecord)}
+        self.assertFalse([name for name in names if name.startswith("_")])
+        pool = ExperiencePool("test")
+        xr = make_xr()
+        pool.deposit(xr)
+        pool.retrieve(min_confidence=0)
+        self.assertEqual(set(asdict(xr)), names)
+
+    def test_record_shared_between_pools(self):
+        trusted, distrusted = ExperiencePool("trusted"), ExperiencePool("distrusted")
+        trusted.trust_engine.update_agent_reputation("agent-1", 0.4)
+        distrusted.trust_engine.update_agent_reputation("agent-1", -0.4)
+        xr = make_xr()
+        expected = trusted.deposit(xr)["confidence_score"]
+        distrusted.deposit(xr)
+        self.assertEqual(trusted.retrieve(min_confidence=0)[0]["confidence_score"], expected)
+
+    def test_scores_follow_trust_inputs(self):
+        pool = ExperiencePool("test")
+        xr = make_xr()
+        pool.deposit(xr)
+        engine = pool.trust_engine
+
+        def cached_score():
+            return pool.retrieve(min_confidence=0)[0]["confidence_score"]
+
+        self.assertEqual(cached_score(), engine.compute_trust_score(xr, pool))
+        engine.update_agent_reputation("agent-1", 0.3)
+        self.assertEqual(cached_score(), engine.compute_trust_score(xr))
+        engine.record_feedback(xr.xr_id, False)
+        self.assertEqual(cached_score(), engine.compute_trust_score(xr))
+        pool.validate(xr.xr_id, "validator", ValidationType.CONFIRM)
+        self.assertEqual(cached_score(), engine.compute_trust_score(xr))
+
+    def test_feedback_loaded_directly_is_scored(self):
+        engine = axtp.TrustEngine()
+        xr = make_xr()
+        engine.outcome_feedback[xr.xr_id] = [True, False, False, False]
+        self.assertEqual(engine.compute_outcome_score(xr.xr_id), 0.25)
+        recorded = axtp.TrustEngine()
+        for helpful in (True, False, False, False):
+            recorded.record_feedback(xr.xr_id, helpful)
+        pool = ExperiencePool("test")
+        pool.trust_engine = engine
+        self.assertEqual(pool.deposit(xr)["confidence_score"], recorded.compute_trust_score(xr))
+        self.assertLess(recorded.compute_trust_score(xr), axtp.TrustEngine().compute_trust_score(xr))
+
+    def test_reassigned_timestamp_is_reparsed(self):
+        pool = ExperiencePool("test")
+        xr = make_xr()
+        pool.deposit(xr)
+        fresh = pool.retrieve(min_confidence=0)[0]["confidence_score"]
+        xr.timestamp = (datetime.now(timezone.utc) - timedelta(days=365)).isoformat()
+        stale = pool.retrieve(min_confidence=0)[0]["confidence_score"]
+        self.assertLess(stale, fresh)
+        self.assertEqual(stale, pool.trust_engine.compute_trust_score(xr, pool))
+
+
+class Color(Enum):
+    RED = 1
+
+
+@unittest.skipIf(axtp.orjson is None, "orjson not installed")
+class TestSerializationParity(unittest.TestCase):
+
+    def make_record(self, environment: dict) -> ExperienceRecord:
+        return make_xr(
+            "code.debug→review",
+            objective="café",
+            environment=environment,
+            steps=[Step(0, "run", "naïve attempt", tool_used="pytest", duration_ms=12)],
+            effective_patterns=[Pattern("p1", "retry", confidence=0.25)],
+            validator_ids=["v1"]
+        )
+
+    def assert_same_output(self, xr: ExperienceRecord, **kwargs):
+        with_orjson = xr.to_json(**kwargs)
+        with mock.patch.object(axtp, "orjson", None):
+            self.assertEqual(xr.to_json(**kwargs), with_orjson)
+
+    def test_compact_and_pretty_match_stdlib(self):
+        xr = self.make_record({
+            "run_id": uuid.UUID(int=1),
+            "validation": ValidationType.CONFIRM,
+            "color": Color.RED,
+            "ratio": 0.1,
+            "nested": [1, None, True, {"k": "→"}],
+            3: "non-str key",
+            "huge": 2 ** 70
+        })
+        self.assert_same_output(xr)
+        self.assert_same_output(xr, pretty=True)
+
+    def test_datetime_rejected_by_both(self):
+        xr = self.make_record({"when": datetime.now(timezone.utc)})
+        with self.assertRaises(TypeError):
+            xr.to_json()
+        with mock.patch.object(axtp, "orjson", None), self.assertRaises(TypeError):
+            xr.to_json()
+
+
+if __name__ == "__main__":
+    unittest.main()